@@ -5,12 +5,15 @@ from dataclasses import dataclass
 
 from .datasources.npy_pod_source import NpyPodFilesystemSource
 from .datasources.base import WindDataSource
+from .utils.pod_reconstruction import POD_MODE_DTYPES
 
 
 @dataclass(frozen=True)
 class AppConfig:
     data_dir: str
     source_kind: str
+    psi_dtype: str = "float32"
+    pod_rank: int | None = None
 
 
 def _require_env(name: str) -> str:
@@ -20,14 +23,34 @@ def _require_env(name: str) -> str:
     return value
 
 
+def _optional_int_env(name: str) -> int | None:
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise RuntimeError(f"Environment variable {name} must be an integer, got '{value}'")
+    if parsed < 1:
+        raise RuntimeError(f"Environment variable {name} must be >= 1, got {parsed}")
+    return parsed
+
+
 def load_config() -> AppConfig:
     data_dir = _require_env("UWV_DATA_DIR")
     source_kind = _require_env("UWV_SOURCE")
-    return AppConfig(data_dir=data_dir, source_kind=source_kind)
+    psi_dtype = os.getenv("UWV_PSI_DTYPE") or "float32"
+    if psi_dtype not in POD_MODE_DTYPES:
+        raise RuntimeError(f"Unsupported UWV_PSI_DTYPE='{psi_dtype}'. Supported: {', '.join(POD_MODE_DTYPES)}")
+    pod_rank = _optional_int_env("UWV_POD_RANK")
+    return AppConfig(data_dir=data_dir, source_kind=source_kind,
+                     psi_dtype=psi_dtype, pod_rank=pod_rank)
 
 
 def build_source(cfg: AppConfig) -> WindDataSource:
     if cfg.source_kind == "npy_pod":
-        return NpyPodFilesystemSource(data_dir=cfg.data_dir)
+        return NpyPodFilesystemSource(data_dir=cfg.data_dir,
+                                      psi_dtype=cfg.psi_dtype,
+                                      pod_rank=cfg.pod_rank)
 
     raise RuntimeError(f"Unsupported UWV_SOURCE='{cfg.source_kind}'. Supported: npy_pod")
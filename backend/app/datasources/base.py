@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol, Sequence
 import numpy as np
 
@@ -31,6 +31,17 @@ class WindQueryPoints:
     wd_ref: float
 
 
+@dataclass(frozen=True)
+class WindPointSelection:
+    """CFD points inside a bbox, reusable for different reference conditions."""
+    dataset_id: str
+    height_m: int
+    bbox: BBoxData
+    idx: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+
+
 @dataclass(frozen=True)
 class WindFieldPoints:
     """Wind data at irregular CFD points (not gridded)."""
@@ -39,6 +50,7 @@ class WindFieldPoints:
     u: np.ndarray
     v: np.ndarray
     w: np.ndarray | None = None
+    debug: dict = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -58,3 +70,5 @@ class WindDataSource(Protocol):
     """Contract for wind data sources."""
     def list_datasets(self) -> list[DatasetMeta]: ...
     def get_wind_points(self, q: WindQueryPoints) -> WindFieldPoints: ...
+    def select_points(self, dataset_id: str, height_m: int, bbox: BBoxData) -> WindPointSelection: ...
+    def reconstruct_points(self, sel: WindPointSelection, ws_ref: float, wd_ref: float) -> WindFieldPoints: ...
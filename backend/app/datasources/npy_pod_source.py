@@ -6,8 +6,8 @@ from typing import Dict, Tuple, Optional
 
 import numpy as np
 
-from .base import DatasetMeta, WindDataSource, BBoxData, WindQueryPoints, WindFieldPoints
-from ..utils.pod_reconstruction import reconstruct_pod_field
+from .base import DatasetMeta, WindDataSource, BBoxData, WindQueryPoints, WindFieldPoints, WindPointSelection
+from ..utils.pod_reconstruction import PodModes, reconstruct_pod_field, quantize_pod_modes, pod_modes_error
 
 
 def _safe_load(path: str) -> np.ndarray:
@@ -35,7 +35,8 @@ class _LoadedHeightSlice:
     Xmean: np.ndarray
     wdNorm: np.ndarray
 
-    Psi: np.ndarray
+    Psi: PodModes
+    pod_error: dict
 
     x_min: float = 0.0
     x_max: float = 0.0
@@ -45,8 +46,10 @@ class _LoadedHeightSlice:
 
 class NpyPodFilesystemSource(WindDataSource):
 
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, psi_dtype: str = "float32", pod_rank: Optional[int] = None):
         self._data_dir = data_dir
+        self._psi_dtype = psi_dtype
+        self._pod_rank = pod_rank
         self._cache: Dict[Tuple[str, int], _LoadedHeightSlice] = {}
 
 
@@ -84,23 +87,46 @@ class NpyPodFilesystemSource(WindDataSource):
 
     def get_wind_points(self, q: WindQueryPoints) -> WindFieldPoints:
         """Returns wind data at irregular CFD points."""
-        sl = self._load_slice(q.dataset_id, q.height_m)
+        sel = self.select_points(q.dataset_id, q.height_m, q.bbox)
+        return self.reconstruct_points(sel, q.ws_ref, q.wd_ref)
+
+
+    def select_points(self, dataset_id: str, height_m: int, bbox: BBoxData) -> WindPointSelection:
+        """Selects the CFD points inside the bbox."""
+        sl = self._load_slice(dataset_id, height_m)
         
         # Filter points in bbox
-        mask = (sl.x >= q.bbox.min_x) & (sl.x <= q.bbox.max_x) & \
-               (sl.y >= q.bbox.min_y) & (sl.y <= q.bbox.max_y)
+        mask = (sl.x >= bbox.min_x) & (sl.x <= bbox.max_x) & \
+               (sl.y >= bbox.min_y) & (sl.y <= bbox.max_y)
         idx = np.where(mask)[0]
+
+        return WindPointSelection(
+            dataset_id=dataset_id, height_m=height_m, bbox=bbox,
+            idx=idx, x=sl.x[idx], y=sl.y[idx]
+        )
+
+
+    def reconstruct_points(self, sel: WindPointSelection, ws_ref: float, wd_ref: float) -> WindFieldPoints:
+        """Reconstructs wind data for a previous point selection."""
+        sl = self._load_slice(sel.dataset_id, sel.height_m)
         
         # POD reconstruction
         ux, uy, uz = reconstruct_pod_field(
             N=len(sl.x), Psi=sl.Psi, A=sl.A, Xmean=sl.Xmean,
-            wdNorm=sl.wdNorm, idx=idx, 
-            ws_ref=q.ws_ref, wd_ref=q.wd_ref
+            wdNorm=sl.wdNorm, idx=sel.idx, 
+            ws_ref=ws_ref, wd_ref=wd_ref
         )
         
         return WindFieldPoints(
-            x=sl.x[idx], y=sl.y[idx],
-            u=ux, v=uy, w=uz
+            x=sel.x, y=sel.y,
+            u=ux, v=uy, w=uz,
+            debug={
+                "pod_dtype": str(sl.Psi.data.dtype),
+                "pod_rank": sl.Psi.rank,
+                "pod_bytes": sl.Psi.nbytes,
+                "pod_rel_rms_error": sl.pod_error["rel_rms_error"],
+                "pod_max_abs_error": sl.pod_error["max_abs_error"],
+            },
         )
     
 
@@ -129,15 +155,21 @@ class NpyPodFilesystemSource(WindDataSource):
         Xmean = _safe_load(pick(f"Xmean_{height_m}.npy", "Xmean.npy")).astype(np.float32).reshape(-1)
 
         psi = _safe_load(pick(f"Psi_{height_m}.npy", "Psi.npy")).astype(np.float32)
+
+        # Compressed mode storage; the float32 reference is only kept for the error metric
+        modes = quantize_pod_modes(psi, dtype=self._psi_dtype, rank=self._pod_rank)
+        pod_error = pod_modes_error(psi, modes, A, Xmean)
+        del psi
         
         sl = _LoadedHeightSlice(
             x=x,
             y=y,
             z=z,
-            A=A,
+            A=A[:modes.rank, :],
             Xmean=Xmean,
             wdNorm=wdNorm,
-            Psi=psi,
+            Psi=modes,
+            pod_error=pod_error,
         )
 
         sl.x_min = float(np.min(x))
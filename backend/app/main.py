@@ -1,16 +1,19 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
 import base64
 import numpy as np
 
-from fastapi import FastAPI, Request, HTTPException, Query
+from fastapi import FastAPI, Request, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from .models import DatasetInfo, WindFieldResponse, BBoxWgs84
+from .models import DatasetInfo, WindFieldResponse, BBoxWgs84, WindStreamMessage
 from .dataset_registry import load_config, build_source
 from .services.wind_service import WindService
+from .services.wind_stream import WindStreamSession
 from .services.crs_transform import bbox_utm_to_wgs84, bbox_wgs84_to_utm
 
 
@@ -42,6 +45,8 @@ def health() -> dict:
         "status": "ok",
         "source": _cfg.source_kind,
         "dataDir": _cfg.data_dir,
+        "psiDtype": _cfg.psi_dtype,
+        "podRank": _cfg.pod_rank,
     }
 
 
@@ -106,4 +111,66 @@ def get_wind(
         speedMax=field.speed_max,
         lon_b64=to_b64_f32(field.lon) if field.lon is not None else None,
         lat_b64=to_b64_f32(field.lat) if field.lat is not None else None,
+        podRelError=field.debug.get("pod_rel_rms_error"),
     )
+
+
+
+@app.websocket("/api/wind/stream")
+async def stream_wind(websocket: WebSocket):
+    """
+    Pushes binary wind frames for a list of timesteps (see services/wind_stream.py).
+    Control messages (JSON): subscribe, update (viewport/timesteps/seek), ack (backpressure).
+    """
+    await websocket.accept()
+
+    session = WindStreamSession(_service)
+    wakeup = asyncio.Event()
+    errors: list[str] = []
+
+    async def receive():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            text = message.get("text")
+            try:
+                if text is None:
+                    raise ValueError("Only JSON text messages are supported")
+                session.handle(WindStreamMessage.model_validate_json(text))
+            except ValueError as exc:
+                errors.append(str(exc))
+            wakeup.set()
+
+    receiver = asyncio.create_task(receive())
+
+    try:
+        while not receiver.done():
+            while errors:
+                await websocket.send_json({"type": "error", "message": errors.pop(0)})
+
+            job = session.next_job()
+            if job is None:
+                wakeup.clear()
+                waiter = asyncio.create_task(wakeup.wait())
+                await asyncio.wait({receiver, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+                continue
+
+            try:
+                result = await run_in_threadpool(job.run) if job.run is not None else None
+                payload = job.finish(result)
+            except (ValueError, RuntimeError, OSError) as exc:
+                job.fail()
+                errors.append(str(exc))
+                continue
+
+            if payload is not None:
+                await websocket.send_bytes(payload)
+
+        receiver.result()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
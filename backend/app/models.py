@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 class BBoxWgs84(BaseModel):
@@ -29,4 +31,27 @@ class WindFieldResponse(BaseModel):
     speedMin: float
     speedMax: float
     lon_b64: str | None = None
-    lat_b64: str | None = None
\ No newline at end of file
+    lat_b64: str | None = None
+    podRelError: float | None = None
+
+
+class StreamTimestep(BaseModel):
+    """Reference conditions of one animation frame."""
+    wsRef: float
+    wdRef: float
+
+
+class WindStreamMessage(BaseModel):
+    """Client control message for the wind stream (subscribe/update/ack)."""
+    type: Literal["subscribe", "update", "ack"]
+    generation: int = Field(0, ge=0, le=0xFFFFFFFF)
+    datasetId: str | None = None
+    heightMeters: int | None = None
+    bbox: BBoxWgs84 | None = None
+    nx: int | None = Field(None, ge=4, le=1024)
+    ny: int | None = Field(None, ge=4, le=1024)
+    timesteps: list[StreamTimestep] | None = Field(None, max_length=1024)
+    startIndex: int | None = Field(None, ge=0)
+    index: int | None = Field(None, ge=0)
+    window: int | None = Field(None, ge=1, le=32)
+    includeCoords: bool | None = None
@@ -6,48 +6,78 @@ import numpy as np
 from ..datasources.base import BBoxData
 
 
-def resample_points_to_grid(
+@dataclass(frozen=True)
+class GridBinning:
+    """Grid cell assignment of scattered points; depends only on geometry."""
+    nx: int
+    ny: int
+    ok: np.ndarray
+    flat: np.ndarray
+    cnt: np.ndarray
+    valid: bool = True
+
+
+def prepare_grid_binning(
     x: np.ndarray,
     y: np.ndarray,
-    u: np.ndarray,
-    v: np.ndarray,
     bbox: BBoxData,
     nx: int,
     ny: int,
-) -> tuple[np.ndarray, np.ndarray, dict]:
+) -> GridBinning:
     x = x.astype(np.float32).reshape(-1)
     y = y.astype(np.float32).reshape(-1)
-    u = u.astype(np.float32).reshape(-1)
-    v = v.astype(np.float32).reshape(-1)
-
-    grid_u = np.full((ny, nx), np.nan, dtype=np.float32)
-    grid_v = np.full((ny, nx), np.nan, dtype=np.float32)
-    count = np.zeros((ny, nx), dtype=np.int32)
 
     w = float(bbox.max_x - bbox.min_x)
     h = float(bbox.max_y - bbox.min_y)
     if w <= 0 or h <= 0:
-        return grid_u, grid_v, {"resample_mode": "invalid_bbox"}
+        empty = np.zeros(0, dtype=np.int64)
+        return GridBinning(nx=nx, ny=ny, ok=np.zeros(x.size, dtype=bool), flat=empty,
+                           cnt=np.zeros(ny * nx, dtype=np.int64), valid=False)
 
     ix = ((x - bbox.min_x) / w * nx).astype(np.int32)
     iy = ((y - bbox.min_y) / h * ny).astype(np.int32)
 
     ok = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
-    ix = ix[ok]
-    iy = iy[ok]
-    uu = u[ok]
-    vv = v[ok]
+    flat = iy[ok].astype(np.int64) * nx + ix[ok]
+    cnt = np.bincount(flat, minlength=ny * nx)
+
+    return GridBinning(nx=nx, ny=ny, ok=ok, flat=flat, cnt=cnt)
+
+
+def resample_points_to_grid(
+    x: np.ndarray,
+    y: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    bbox: BBoxData,
+    nx: int,
+    ny: int,
+) -> tuple[np.ndarray, np.ndarray, dict]:
+    binning = prepare_grid_binning(x, y, bbox, nx, ny)
+    return resample_binned(binning, u, v)
+
+
+def resample_binned(
+    binning: GridBinning,
+    u: np.ndarray,
+    v: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, dict]:
+    nx, ny = binning.nx, binning.ny
+    u = u.astype(np.float32).reshape(-1)
+    v = v.astype(np.float32).reshape(-1)
+
+    if not binning.valid:
+        grid_u = np.full((ny, nx), np.nan, dtype=np.float32)
+        grid_v = np.full((ny, nx), np.nan, dtype=np.float32)
+        return grid_u, grid_v, {"resample_mode": "invalid_bbox"}
 
-    flat = iy * nx + ix
-    sum_u = np.zeros(ny * nx, dtype=np.float64)
-    sum_v = np.zeros(ny * nx, dtype=np.float64)
-    cnt = np.zeros(ny * nx, dtype=np.int32)
+    uu = u[binning.ok]
+    vv = v[binning.ok]
 
-    np.add.at(sum_u, flat, uu.astype(np.float64))
-    np.add.at(sum_v, flat, vv.astype(np.float64))
-    np.add.at(cnt, flat, 1)
+    sum_u = np.bincount(binning.flat, weights=uu.astype(np.float64), minlength=ny * nx)
+    sum_v = np.bincount(binning.flat, weights=vv.astype(np.float64), minlength=ny * nx)
 
-    cnt2 = cnt.reshape(ny, nx)
+    cnt2 = binning.cnt.reshape(ny, nx)
     with np.errstate(invalid="ignore", divide="ignore"):
         grid_u = (sum_u.reshape(ny, nx) / np.maximum(cnt2, 1)).astype(np.float32)
         grid_v = (sum_v.reshape(ny, nx) / np.maximum(cnt2, 1)).astype(np.float32)
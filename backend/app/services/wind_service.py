@@ -1,9 +1,23 @@
-from ..datasources.base import WindDataSource, WindQueryPoints, WindField, BBoxData
-from .resample import resample_points_to_grid
+from dataclasses import dataclass
+
+from ..datasources.base import WindDataSource, WindPointSelection, WindField, BBoxData
+from .resample import GridBinning, prepare_grid_binning, resample_binned
 from .crs_transform import require_env
 import numpy as np
 from pyproj import CRS, Transformer
 
+
+@dataclass(frozen=True)
+class WindView:
+    """Geometry shared by all frames of one dataset/height/bbox/grid."""
+    selection: WindPointSelection
+    binning: GridBinning
+    nx: int
+    ny: int
+    lon: np.ndarray | None = None
+    lat: np.ndarray | None = None
+
+
 class WindService:
     """Business logic for wind data operations."""
     
@@ -26,28 +40,30 @@ class WindService:
         include_coords: bool = True,
     ) -> WindField:
         """Get gridded wind field (with resampling)."""
-        
-        # Load points
-        points = self._source.get_wind_points(WindQueryPoints(
+        view = self.prepare_view(
             dataset_id=dataset_id,
             height_m=height_m,
             bbox=bbox,
-            ws_ref=ws_ref,
-            wd_ref=wd_ref
-        ))
-        
-        # Interpolate grid
-        grid_u, grid_v, debug = resample_points_to_grid(
-            x=points.x, y=points.y, 
-            u=points.u, v=points.v,
-            bbox=bbox, nx=nx, ny=ny
+            nx=nx, ny=ny,
+            include_coords=include_coords,
         )
+        return self.get_wind_frame(view, ws_ref=ws_ref, wd_ref=wd_ref)
+
+    def prepare_view(
+        self,
+        dataset_id: str,
+        height_m: int,
+        bbox: BBoxData,
+        nx: int,
+        ny: int,
+        include_coords: bool = True,
+    ) -> WindView:
+        """Select points, grid binning and WGS84 coordinates once for many frames."""
         
-        # Compute statistics
-        speed = np.hypot(grid_u, grid_v)
-        speed_min = float(np.nanmin(speed)) if np.isfinite(speed).any() else float("nan")
-        speed_max = float(np.nanmax(speed)) if np.isfinite(speed).any() else float("nan")
-        
+        # Select points
+        selection = self._source.select_points(dataset_id, height_m, bbox)
+        binning = prepare_grid_binning(selection.x, selection.y, bbox, nx, ny)
+
         # Compute WGS84 grid coordinates
         lon_grid = None
         lat_grid = None
@@ -68,13 +84,35 @@ class WindService:
             lon_grid, lat_grid = transformer.transform(xx.ravel(), yy.ravel())
             lon_grid = np.array(lon_grid, dtype=np.float32)
             lat_grid = np.array(lat_grid, dtype=np.float32)
+
+        return WindView(
+            selection=selection,
+            binning=binning,
+            nx=nx, ny=ny,
+            lon=lon_grid,
+            lat=lat_grid,
+        )
+
+    def get_wind_frame(self, view: WindView, ws_ref: float, wd_ref: float) -> WindField:
+        """Reconstruct and grid one frame for a prepared view."""
+        
+        # Reconstruct points
+        points = self._source.reconstruct_points(view.selection, ws_ref=ws_ref, wd_ref=wd_ref)
+        
+        # Interpolate grid
+        grid_u, grid_v, debug = resample_binned(view.binning, u=points.u, v=points.v)
+        
+        # Compute statistics
+        speed = np.hypot(grid_u, grid_v)
+        speed_min = float(np.nanmin(speed)) if np.isfinite(speed).any() else float("nan")
+        speed_max = float(np.nanmax(speed)) if np.isfinite(speed).any() else float("nan")
         
         return WindField(
             u=grid_u.ravel(), 
             v=grid_v.ravel(),
             speed_min=speed_min, 
             speed_max=speed_max,
-            debug=debug,
-            lon=lon_grid,
-            lat=lat_grid,
-        )
\ No newline at end of file
+            debug={**points.debug, **debug},
+            lon=view.lon,
+            lat=view.lat,
+        )
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import numpy as np
+
+from ..datasources.base import WindField
+from ..models import BBoxWgs84, WindStreamMessage
+from .crs_transform import bbox_wgs84_to_utm
+from .wind_service import WindService, WindView
+
+
+FRAME_COORDS = 0
+FRAME_WIND = 1
+
+# kind, generation, index, nx, ny, speedMin, speedMax (little-endian),
+# followed by two float32 arrays of nx*ny values (lon/lat or u/v).
+# Coordinate frames carry the generation of the request that changed the view.
+FRAME_HEADER = struct.Struct("<IIIIIff")
+
+# Per connection; enough for a day of 15 min steps at 100x100
+FRAME_CACHE_BYTES = 8 * 1024 * 1024
+
+
+def encode_frame(
+    kind: int,
+    generation: int,
+    index: int,
+    nx: int,
+    ny: int,
+    a: np.ndarray,
+    b: np.ndarray,
+    speed_min: float = 0.0,
+    speed_max: float = 0.0,
+) -> bytes:
+    header = FRAME_HEADER.pack(kind, generation, index, nx, ny, speed_min, speed_max)
+    return header + np.asarray(a, dtype="<f4").tobytes() + np.asarray(b, dtype="<f4").tobytes()
+
+
+@dataclass(frozen=True)
+class StreamJob:
+    """
+    Unit of work: `run` is blocking (thread pool), `finish` returns the payload
+    to send and `fail` is called instead if `run` raised.
+    """
+    run: Callable[[], Any] | None
+    finish: Callable[[Any], bytes | None]
+    fail: Callable[[], None] = lambda: None
+
+
+class WindStreamSession:
+    """
+    Per-connection state of the wind stream.
+    Frames are pushed at most `window` timesteps ahead of the last acked index.
+    The view (point subset, grid binning, coordinates) is only rebuilt when
+    dataset, height, bbox or grid change.
+    """
+
+    def __init__(self, service: WindService, window: int = 4):
+        self._service = service
+        self._window = window
+        self._generation = 0
+
+        self._dataset_id: str | None = None
+        self._height_m = 0
+        self._bbox: BBoxWgs84 | None = None
+        self._nx = 48
+        self._ny = 36
+        self._include_coords = True
+        self._timesteps: list[tuple[float, float]] = []
+
+        self._view: WindView | None = None
+        self._view_version = 0
+        self._view_ready = 0
+        self._view_generation = 0
+        self._content_version = 0
+        self._frames: dict[int, WindField] = {}
+        self._frames_bytes = 0
+        self._coords_pending = False
+
+        # Unwrapped positions, frame index = position % len(timesteps)
+        self._cursor = 0
+        self._played = 0
+
+
+    def handle(self, msg: WindStreamMessage) -> None:
+        """Applies a client control message."""
+        if msg.type == "ack":
+            if msg.generation == self._generation and msg.index is not None and self._timesteps:
+                # Only move forward within the frames already sent
+                step = (msg.index - self._played) % len(self._timesteps)
+                if step <= self._cursor - self._played:
+                    self._played += step
+            return
+
+        if msg.type == "subscribe":
+            if msg.datasetId is None or msg.heightMeters is None or msg.bbox is None or msg.timesteps is None:
+                raise ValueError("subscribe requires datasetId, heightMeters, bbox and timesteps")
+        elif self._dataset_id is None:
+            raise ValueError("update before subscribe")
+
+        if msg.bbox is not None:
+            b = msg.bbox
+            if not (b.minLon < b.maxLon and b.minLat < b.maxLat):
+                raise ValueError("Invalid bbox")
+
+        view_params = (self._dataset_id, self._height_m, self._bbox, self._nx, self._ny, self._include_coords)
+        if msg.datasetId is not None:
+            self._dataset_id = msg.datasetId
+        if msg.heightMeters is not None:
+            self._height_m = msg.heightMeters
+        if msg.bbox is not None:
+            self._bbox = msg.bbox
+        if msg.nx is not None:
+            self._nx = msg.nx
+        if msg.ny is not None:
+            self._ny = msg.ny
+        if msg.includeCoords is not None:
+            self._include_coords = msg.includeCoords
+        if msg.window is not None:
+            self._window = msg.window
+
+        changed = False
+        view_changed = view_params != (self._dataset_id, self._height_m, self._bbox, self._nx, self._ny, self._include_coords)
+        view_failed = self._view is None and self._view_ready == self._view_version
+        if view_changed:
+            self._view_generation = msg.generation
+        if view_changed or view_failed:
+            self._view_version += 1
+            changed = True
+        if msg.timesteps is not None:
+            self._timesteps = [(t.wsRef, t.wdRef) for t in msg.timesteps]
+            changed = True
+        if changed:
+            self._content_version += 1
+            self._frames.clear()
+            self._frames_bytes = 0
+
+        n = len(self._timesteps)
+        if msg.startIndex is not None:
+            start = msg.startIndex
+        else:
+            start = self._played
+        start = start % n if n else 0
+
+        self._generation = msg.generation
+        self._cursor = start
+        self._played = start
+
+
+    def next_job(self) -> StreamJob | None:
+        """Returns the next unit of work, or None while idle or out of credit."""
+        if self._dataset_id is None or self._bbox is None:
+            return None
+
+        if self._view_ready != self._view_version:
+            return self._view_job()
+
+        if self._view is None:
+            return None
+        if self._coords_pending:
+            self._coords_pending = False
+            if self._view.lon is not None:
+                return self._coords_job()
+
+        n = len(self._timesteps)
+        if n == 0:
+            return None
+        if self._cursor - self._played > min(self._window, n - 1):
+            return None
+
+        index = self._cursor % n
+        self._cursor += 1
+        return self._frame_job(index)
+
+
+    def _view_job(self) -> StreamJob:
+        version = self._view_version
+        dataset_id, height_m, bbox = self._dataset_id, self._height_m, self._bbox
+        nx, ny, include_coords = self._nx, self._ny, self._include_coords
+
+        def run() -> WindView:
+            return self._service.prepare_view(
+                dataset_id=dataset_id,
+                height_m=height_m,
+                bbox=bbox_wgs84_to_utm(bbox),
+                nx=nx, ny=ny,
+                include_coords=include_coords,
+            )
+
+        def finish(view: WindView) -> bytes | None:
+            if version == self._view_version:
+                self._view = view
+                self._view_ready = version
+                self._coords_pending = True
+            return None
+
+        def fail() -> None:
+            # Rebuilt on the next subscribe/update, see handle()
+            if version == self._view_version:
+                self._view = None
+                self._view_ready = version
+
+        return StreamJob(run=run, finish=finish, fail=fail)
+
+
+    def _coords_job(self) -> StreamJob:
+        view = self._view
+        payload = encode_frame(FRAME_COORDS, self._view_generation, 0, view.nx, view.ny, view.lon, view.lat)
+        return StreamJob(run=None, finish=lambda _: payload)
+
+
+    def _frame_job(self, index: int) -> StreamJob:
+        generation = self._generation
+        content_version = self._content_version
+        view = self._view
+
+        def encode(field: WindField) -> bytes | None:
+            if generation != self._generation:
+                return None
+            return encode_frame(FRAME_WIND, generation, index, view.nx, view.ny,
+                                field.u, field.v, field.speed_min, field.speed_max)
+
+        cached = self._frames.get(index)
+        if cached is not None:
+            return StreamJob(run=None, finish=lambda _: encode(cached))
+
+        ws_ref, wd_ref = self._timesteps[index]
+
+        def run() -> WindField:
+            return self._service.get_wind_frame(view, ws_ref=ws_ref, wd_ref=wd_ref)
+
+        def finish(field: WindField) -> bytes | None:
+            if content_version != self._content_version:
+                return None
+
+            size = field.u.nbytes + field.v.nbytes
+            if self._frames_bytes + size <= FRAME_CACHE_BYTES:
+                self._frames[index] = field
+                self._frames_bytes += size
+            return encode(field)
+
+        return StreamJob(run=run, finish=finish)
@@ -1,10 +1,121 @@
+from dataclasses import dataclass
+
 import numpy as np
 
 
+POD_MODE_DTYPES = {
+    "float32": np.float32,
+    "float16": np.float16,
+    "int16": np.int16,
+    "int8": np.int8,
+}
+
+
+@dataclass(frozen=True)
+class PodModes:
+    """
+    POD modes (Psi) stored in reduced precision and/or truncated rank.
+    Integer storage uses a per-mode affine mapping:
+    Psi[:, k] ~= data[:, k] * scale[k] + offset[k]
+    """
+    data: np.ndarray
+    scale: np.ndarray | None = None
+    offset: np.ndarray | None = None
+
+    @property
+    def rank(self) -> int:
+        return int(self.data.shape[1])
+
+    @property
+    def nbytes(self) -> int:
+        extra = 0
+        if self.scale is not None and self.offset is not None:
+            extra = self.scale.nbytes + self.offset.nbytes
+        return int(self.data.nbytes + extra)
+
+
+def quantize_pod_modes(
+    Psi: np.ndarray,
+    *,
+    dtype: str = "float32",
+    rank: int | None = None
+) -> PodModes:
+    """Converts float32 modes into the requested storage dtype, keeping the first `rank` modes."""
+    if dtype not in POD_MODE_DTYPES:
+        raise RuntimeError(f"Unsupported POD mode dtype '{dtype}'. Supported: {', '.join(POD_MODE_DTYPES)}")
+
+    r = Psi.shape[1] if rank is None else max(1, min(rank, Psi.shape[1]))
+    Psi = Psi[:, :r]
+    target = np.dtype(POD_MODE_DTYPES[dtype])
+
+    if target.kind == "f":
+        limit = float(np.finfo(target).max)
+        if Psi.size and float(np.max(np.abs(Psi))) > limit:
+            raise RuntimeError(f"POD modes exceed the {dtype} range (|Psi| > {limit:g})")
+        return PodModes(data=np.ascontiguousarray(Psi, dtype=target))
+
+    # Symmetric integer range around the per-mode midpoint
+    qmax = np.iinfo(target).max
+    lo = Psi.min(axis=0)
+    hi = Psi.max(axis=0)
+    offset = ((hi + lo) * 0.5).astype(np.float32)
+    scale = ((hi - lo) * 0.5 / qmax).astype(np.float32)
+    scale[scale == 0] = 1.0
+
+    q = np.rint((Psi - offset) / scale)
+    np.clip(q, -qmax, qmax, out=q)
+    return PodModes(data=np.ascontiguousarray(q, dtype=target), scale=scale, offset=offset)
+
+
+def _project_modes(modes: PodModes, rows, coeffs: np.ndarray) -> np.ndarray:
+    """Computes Psi[rows, :] @ coeffs directly on the stored representation."""
+    sub = modes.data[rows, :].astype(np.float32, copy=False)
+    if modes.scale is None or modes.offset is None:
+        return sub @ coeffs
+
+    # (q * s + o) @ a == q @ (s * a) + o @ a
+    shape = (-1,) + (1,) * (coeffs.ndim - 1)
+    return sub @ (coeffs * modes.scale.reshape(shape)) + modes.offset @ coeffs
+
+
+def pod_modes_error(
+    Psi_ref: np.ndarray,
+    modes: PodModes,
+    A: np.ndarray,
+    Xmean: np.ndarray,
+    *,
+    chunk_rows: int = 65536
+) -> dict:
+    """
+    Compares reconstructions at the stored wind directions (columns of A)
+    against the float32 reference. Errors are given for ws_ref = 1.
+    """
+    if modes.scale is None and modes.data.dtype == Psi_ref.dtype and modes.rank == Psi_ref.shape[1]:
+        return {"rel_rms_error": 0.0, "max_abs_error": 0.0}
+
+    A_trunc = A[:modes.rank, :]
+    sq_err = 0.0
+    sq_ref = 0.0
+    max_abs = 0.0
+
+    for start in range(0, Psi_ref.shape[0], chunk_rows):
+        rows = slice(start, start + chunk_rows)
+        mean = Xmean[rows, None]
+        ref = Psi_ref[rows, :] @ A + mean
+        diff = _project_modes(modes, rows, A_trunc) + mean - ref
+
+        sq_err += float(np.sum(np.square(diff, dtype=np.float64)))
+        sq_ref += float(np.sum(np.square(ref, dtype=np.float64)))
+        max_abs = max(max_abs, float(np.max(np.abs(diff))))
+
+    rel = float(np.sqrt(sq_err / sq_ref)) if sq_ref > 0 else 0.0
+    return {"rel_rms_error": rel, "max_abs_error": max_abs}
+
+
 def reconstruct_pod_field(
     *,
     N: int,
-    Psi: np.ndarray,
+    Psi: np.ndarray | PodModes,
     A: np.ndarray,
     Xmean: np.ndarray,
     wdNorm: np.ndarray,
@@ -15,21 +126,22 @@ def reconstruct_pod_field(
     """
     Generic POD reconstruction using the following formular:
     U = (Psi @ A + Xmean) * ws_ref
-    """        
+    Psi may be given as PodModes to reconstruct from quantized/truncated storage.
+    """
+    modes = Psi if isinstance(Psi, PodModes) else PodModes(data=Psi)
 
-    # Interpolate coefficients (direction)
+    # Interpolate coefficients (direction), only for the stored modes
     AInterp = np.array([
         np.interp(wd_ref, wdNorm, A[i, :], period=360)
-        for i in range(A.shape[0])
+        for i in range(modes.rank)
     ])
 
     # Build subset for selected ids (stacked data in Psi and Xmean)
     subset_idx_stacked = np.concatenate([idx, idx + N, idx + 2*N])
 
     # Reconstruct data for the calculated subset
-    Psi_subset = Psi[subset_idx_stacked, :]
     Xmean_subset = Xmean[subset_idx_stacked]
-    U_subset = (Psi_subset @ AInterp + Xmean_subset) * ws_ref
+    U_subset = (_project_modes(modes, subset_idx_stacked, AInterp) + Xmean_subset) * ws_ref
 
     # Split components for result
     Ux, Uy, Uz = np.split(U_subset, 3)
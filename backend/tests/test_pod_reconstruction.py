@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from app.utils.pod_reconstruction import quantize_pod_modes, pod_modes_error, reconstruct_pod_field
+
+
+def _random_pod(N: int = 200, modes: int = 6, dirs: int = 12):
+    rng = np.random.default_rng(0)
+    Psi = rng.standard_normal((3 * N, modes)).astype(np.float32)
+    A = rng.standard_normal((modes, dirs)).astype(np.float32) / np.arange(1, modes + 1)[:, None]
+    Xmean = rng.standard_normal(3 * N).astype(np.float32)
+    wdNorm = np.linspace(0, 360, dirs, endpoint=False).astype(np.float32)
+    return N, Psi, A, Xmean, wdNorm
+
+
+@pytest.mark.parametrize("dtype, tol", [("float16", 1e-3), ("int16", 1e-3), ("int8", 5e-2)])
+def test_quantized_reconstruction_matches_float32(dtype, tol):
+    N, Psi, A, Xmean, wdNorm = _random_pod()
+    idx = np.arange(0, N, 3)
+    kwargs = dict(N=N, A=A, Xmean=Xmean, wdNorm=wdNorm, idx=idx, ws_ref=8.0, wd_ref=123.0)
+
+    ref = reconstruct_pod_field(Psi=Psi, **kwargs)
+    modes = quantize_pod_modes(Psi, dtype=dtype)
+    approx = reconstruct_pod_field(Psi=modes, **kwargs)
+
+    assert modes.data.dtype == np.dtype(dtype)
+    for r, a in zip(ref, approx):
+        assert np.linalg.norm(a - r) / np.linalg.norm(r) < tol
+
+    err = pod_modes_error(Psi, modes, A, Xmean)
+    assert 0.0 < err["rel_rms_error"] < tol
+
+
+def test_truncated_rank_reports_error():
+    N, Psi, A, Xmean, wdNorm = _random_pod()
+
+    full = pod_modes_error(Psi, quantize_pod_modes(Psi), A, Xmean)
+    modes = quantize_pod_modes(Psi, rank=3)
+    truncated = pod_modes_error(Psi, modes, A, Xmean, chunk_rows=64)
+
+    assert modes.rank == 3
+    assert full["rel_rms_error"] == 0.0
+    assert truncated["rel_rms_error"] > 0.0
+
+    # Reconstruction uses only the stored modes, so a truncated A gives the same result
+    kwargs = dict(N=N, Psi=modes, Xmean=Xmean, wdNorm=wdNorm, idx=np.arange(N), ws_ref=1.0, wd_ref=45.0)
+    for a, b in zip(reconstruct_pod_field(A=A, **kwargs), reconstruct_pod_field(A=A[:3], **kwargs)):
+        np.testing.assert_allclose(a, b)
+
+
+def test_unsupported_dtype():
+    with pytest.raises(RuntimeError):
+        quantize_pod_modes(np.zeros((3, 2), dtype=np.float32), dtype="int4")
+
+
+def test_float16_overflow():
+    with pytest.raises(RuntimeError):
+        quantize_pod_modes(np.full((3, 2), 1e5, dtype=np.float32), dtype="float16")
+
+
+def test_config_rejects_unknown_dtype(monkeypatch):
+    from app.dataset_registry import load_config
+
+    monkeypatch.setenv("UWV_DATA_DIR", "/tmp")
+    monkeypatch.setenv("UWV_SOURCE", "npy_pod")
+    monkeypatch.setenv("UWV_PSI_DTYPE", "fp16")
+    with pytest.raises(RuntimeError, match="UWV_PSI_DTYPE"):
+        load_config()
@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from app.datasources.npy_pod_source import NpyPodFilesystemSource
+from app.models import WindStreamMessage
+from app.services.crs_transform import bbox_utm_to_wgs84
+from app.services.wind_service import WindService
+from app.services.wind_stream import FRAME_COORDS, FRAME_HEADER, FRAME_WIND, WindStreamSession
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("UWV_CRS_WIND", "EPSG:32633")
+
+    N = 400
+    rng = np.random.default_rng(0)
+    base = tmp_path / "area" / "70m"
+    base.mkdir(parents=True)
+    arrays = {
+        "x": 400000 + rng.random(N) * 1000,
+        "y": 5800000 + rng.random(N) * 1000,
+        "z": np.full(N, 70.0),
+        "A": rng.standard_normal((4, 12)),
+        "wdNorm": np.arange(0, 360, 30),
+        "Xmean": rng.standard_normal(3 * N),
+        "Psi": rng.standard_normal((3 * N, 4)),
+    }
+    for name, arr in arrays.items():
+        np.save(base / f"{name}.npy", arr)
+
+    return WindService(NpyPodFilesystemSource(data_dir=str(tmp_path)))
+
+
+def _run(session):
+    payloads = []
+    while (job := session.next_job()) is not None:
+        payload = job.finish(job.run() if job.run is not None else None)
+        if payload is not None:
+            payloads.append(FRAME_HEADER.unpack_from(payload))
+    return payloads
+
+
+def _subscribe(service, **extra):
+    meta = service.list_datasets()[0]
+    msg = {
+        "type": "subscribe",
+        "generation": 1,
+        "datasetId": meta.id,
+        "heightMeters": 70,
+        "bbox": bbox_utm_to_wgs84(meta.bbox).model_dump(),
+        "nx": 8,
+        "ny": 6,
+        "timesteps": [{"wsRef": 5.0 + i, "wdRef": 30.0 * i} for i in range(5)],
+        "window": 2,
+    }
+    msg.update(extra)
+    return WindStreamMessage.model_validate(msg)
+
+
+def test_stream_respects_window_and_acks(service):
+    session = WindStreamSession(service)
+    session.handle(_subscribe(service))
+
+    headers = _run(session)
+    assert [(h[0], h[2]) for h in headers] == [(FRAME_COORDS, 0), (FRAME_WIND, 0), (FRAME_WIND, 1), (FRAME_WIND, 2)]
+    assert all(h[1] == 1 and h[3:5] == (8, 6) for h in headers)
+
+    session.handle(WindStreamMessage(type="ack", generation=1, index=1))
+    assert [h[2] for h in _run(session)] == [3]
+
+    # Stale and backward acks are ignored
+    session.handle(WindStreamMessage(type="ack", generation=0, index=3))
+    session.handle(WindStreamMessage(type="ack", generation=1, index=0))
+    assert _run(session) == []
+
+
+def test_stream_update_keeps_view_on_seek(service):
+    session = WindStreamSession(service)
+    session.handle(_subscribe(service))
+    _run(session)
+
+    session.handle(WindStreamMessage(type="update", generation=2, startIndex=4))
+    headers = _run(session)
+    # Coordinates are not sent again when the view is unchanged
+    assert [(h[0], h[1], h[2]) for h in headers] == [(FRAME_WIND, 2, 4), (FRAME_WIND, 2, 0), (FRAME_WIND, 2, 1)]
+
+    session.handle(WindStreamMessage(type="update", generation=3, nx=10, startIndex=0))
+    session.handle(WindStreamMessage(type="update", generation=4, startIndex=2))
+    headers = _run(session)
+    # Coordinates keep the generation of the view change across later seeks
+    assert [(h[0], h[1]) for h in headers] == [(FRAME_COORDS, 3), (FRAME_WIND, 4), (FRAME_WIND, 4), (FRAME_WIND, 4)]
+    assert headers[1][3:5] == (10, 6)
+
+
+def test_update_before_subscribe(service):
+    session = WindStreamSession(service)
+    with pytest.raises(ValueError):
+        session.handle(WindStreamMessage(type="update", generation=1, startIndex=0))
+
+
+def test_failed_view_is_rebuilt_on_update(service):
+    session = WindStreamSession(service)
+    session.handle(_subscribe(service, datasetId="missing"))
+
+    job = session.next_job()
+    with pytest.raises(OSError):
+        job.run()
+    job.fail()
+    assert session.next_job() is None
+
+    session.handle(_subscribe(service, datasetId="missing", generation=2))
+    assert session.next_job() is not None
+
+    session.handle(_subscribe(service, generation=3))
+    assert [h[0] for h in _run(session)][:2] == [FRAME_COORDS, FRAME_WIND]
+
+
+def test_failed_frame_keeps_view(service):
+    session = WindStreamSession(service)
+    session.handle(_subscribe(service))
+    _run(session)
+
+    session.handle(WindStreamMessage(type="update", generation=2, startIndex=0))
+    session.next_job().fail()
+    assert [h[2] for h in _run(session)] == [1, 2]
+
+
+def test_stream_endpoint(service, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import app.main
+
+    monkeypatch.setattr(app.main, "_service", service)
+    client = TestClient(app.main.app)
+
+    with client.websocket_connect("/api/wind/stream") as ws:
+        ws.send_bytes(b"\x00")
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_text(_subscribe(service).model_dump_json())
+        headers = [FRAME_HEADER.unpack_from(ws.receive_bytes()) for _ in range(4)]
+        assert [h[0] for h in headers] == [FRAME_COORDS, FRAME_WIND, FRAME_WIND, FRAME_WIND]
+
+        ws.send_text(WindStreamMessage(type="ack", generation=1, index=1).model_dump_json())
+        assert FRAME_HEADER.unpack_from(ws.receive_bytes())[2] == 3
+
+        ws.send_text(WindStreamMessage(type="update", generation=2, datasetId="missing").model_dump_json())
+        assert ws.receive_json()["type"] == "error"
+
+        # The stream recovers once the client switches back to a valid dataset
+        ws.send_text(_subscribe(service, generation=3).model_dump_json())
+        assert FRAME_HEADER.unpack_from(ws.receive_bytes())[:2] == (FRAME_COORDS, 3)
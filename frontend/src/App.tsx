@@ -7,6 +7,7 @@ import { checkHealth } from "./api/health";
 import type { BBox, DatasetInfo, WindFieldGrid } from "./api/contract";
 import { fetchDatasets } from "./api/datasets";
 import { fetchWindFieldHttp } from "./api/wind";
+import { WindStream, type WindStreamParams } from "./api/windStream";
 import "./index.css";
 import type { VisualizationType } from "./map/config";
 import { useUrlState, buildPermalink } from "./util/urlStats";
@@ -61,6 +62,10 @@ export function App() {
   const [currentDate, setCurrentDate] = useState(getDefaultDate());
   const [timeControlMinimized, setTimeControlMinimized] = useState(false);
 
+  const streamRef = useRef<WindStream | null>(null);
+  const [streamWaiting, setStreamWaiting] = useState(false);
+  const [streamFailed, setStreamFailed] = useState(false);
+
   const weatherTimesteps = useMemo(() => {
     return interpolateTimesteps(hourlyWeatherData, timestepInterval);
   }, [hourlyWeatherData, timestepInterval]);
@@ -68,7 +73,7 @@ export function App() {
   const { currentIndex, setCurrentIndex } = useAnimation(
     weatherTimesteps.length,
     playbackSpeed,
-    playing && !queryInProgress
+    playing && !queryInProgress && !streamWaiting
   );
 
   useEffect(() => {
@@ -77,6 +82,12 @@ export function App() {
 
   const currentWeather = weatherTimesteps[currentIndex];
 
+  const currentIndexRef = useRef(currentIndex);
+
+  useEffect(() => {
+    currentIndexRef.current = currentIndex;
+  }, [currentIndex]);
+
   useEffect(() => {
     let cancelled = false;
     let ac: AbortController | null = null;
@@ -220,8 +231,85 @@ export function App() {
     currentWeather,
   ]);
 
+  const streamParams = useMemo<WindStreamParams | null>(() => {
+    if (!bbox || !selectedDataset || heightMeters === null) return null;
+    if (weatherTimesteps.length === 0) return null;
+
+    return {
+      datasetId: selectedDataset.id,
+      heightMeters,
+      bbox,
+      resolution,
+      timesteps: weatherTimesteps,
+    };
+  }, [bbox, selectedDataset, heightMeters, resolution, weatherTimesteps]);
+
+  const streamParamsRef = useRef(streamParams);
+  const hasStreamParams = streamParams !== null;
+
+  useEffect(() => {
+    streamParamsRef.current = streamParams;
+  }, [streamParams]);
+
+  useEffect(() => {
+    if (!playing) setStreamFailed(false);
+  }, [playing]);
+
+  // During playback frames are pushed over a WebSocket instead of one request per timestep.
+  // If the stream fails, playback falls back to HTTP until it is restarted.
+  useEffect(() => {
+    if (!playing || streamFailed || !hasStreamParams) return;
+
+    const stream = new WindStream(
+      streamParamsRef.current!,
+      currentIndexRef.current
+    );
+    stream.onFrame = (index) => {
+      if (index !== currentIndexRef.current) return;
+      const frame = stream.take(index);
+      if (frame) {
+        setWindField(frame);
+        setStreamWaiting(false);
+      }
+    };
+    stream.onError = (message) => {
+      console.error(message);
+      setStreamFailed(true);
+    };
+    stream.onClose = () => {
+      console.error("wind stream closed");
+      setStreamFailed(true);
+    };
+    streamRef.current = stream;
+
+    return () => {
+      stream.close();
+      streamRef.current = null;
+      setStreamWaiting(false);
+    };
+  }, [playing, streamFailed, hasStreamParams]);
+
+  useEffect(() => {
+    if (streamParams) {
+      streamRef.current?.update(streamParams, currentIndexRef.current);
+    }
+  }, [streamParams]);
+
+  useEffect(() => {
+    const stream = streamRef.current;
+    if (!playing || !stream) return;
+
+    const frame = stream.take(currentIndex);
+    if (frame) {
+      setWindField(frame);
+      setStreamWaiting(false);
+    } else {
+      setStreamWaiting(true);
+    }
+  }, [playing, currentIndex, streamParams]);
+
   useEffect(() => {
-    if (!query) return;
+    if (!query || (playing && !streamFailed)) return;
 
     const ac = new AbortController();
     setLoading(true);
@@ -238,7 +326,7 @@ export function App() {
       });
 
     return () => ac.abort();
-  }, [query]);
+  }, [query, playing, streamFailed]);
 
   const onViewportBbox = useCallback(
     (b: BBox) => {
@@ -0,0 +1,212 @@
+import { API_BASE } from "./config";
+import type { BBox, WindFieldGrid } from "./contract";
+
+export type WindStreamParams = {
+  datasetId: string;
+  heightMeters: number;
+  bbox: BBox;
+  resolution: { nx: number; ny: number };
+  timesteps: { wsRef: number; wdRef: number }[];
+};
+
+// Binary frame layout (little-endian), see backend services/wind_stream.py:
+// kind, generation, index, nx, ny (uint32), speedMin, speedMax (float32),
+// followed by two float32 arrays of nx*ny values (lon/lat or u/v).
+// Coordinate frames carry the generation of the request that changed the view.
+const FRAME_COORDS = 0;
+const FRAME_WIND = 1;
+const HEADER_BYTES = 28;
+
+const DEFAULT_WINDOW = 4;
+
+function sameBBox(a: BBox, b: BBox): boolean {
+  return (
+    a.minLon === b.minLon &&
+    a.maxLon === b.maxLon &&
+    a.minLat === b.minLat &&
+    a.maxLat === b.maxLat
+  );
+}
+
+export class WindStream {
+  onFrame?: (index: number) => void;
+  onError?: (message: string) => void;
+  onClose?: () => void;
+
+  private ws: WebSocket;
+  private generation = 0;
+  private viewGeneration = 0;
+  private position: number;
+  private params: WindStreamParams;
+  private window: number;
+  private queue: string[] = [];
+  private frames = new Map<number, WindFieldGrid>();
+  private lon?: Float32Array;
+  private lat?: Float32Array;
+
+  constructor(
+    params: WindStreamParams,
+    startIndex: number,
+    window = DEFAULT_WINDOW
+  ) {
+    this.params = params;
+    this.window = window;
+    this.position = startIndex;
+
+    this.ws = new WebSocket(`${API_BASE.replace(/^http/, "ws")}/api/wind/stream`);
+    this.ws.binaryType = "arraybuffer";
+    this.ws.onopen = () => {
+      for (const msg of this.queue) this.ws.send(msg);
+      this.queue = [];
+    };
+    this.ws.onmessage = (ev) => this.receive(ev.data);
+    // an error event is always followed by close
+    this.ws.onclose = () => this.onClose?.();
+
+    this.generation++;
+    this.viewGeneration = this.generation;
+    this.send({
+      type: "subscribe",
+      generation: this.generation,
+      datasetId: params.datasetId,
+      heightMeters: params.heightMeters,
+      bbox: params.bbox,
+      nx: params.resolution.nx,
+      ny: params.resolution.ny,
+      timesteps: params.timesteps,
+      startIndex,
+      window,
+    });
+  }
+
+  /** Changes viewport/timesteps mid-stream; the server keeps shared state where possible. */
+  update(params: WindStreamParams, startIndex: number) {
+    const prev = this.params;
+    const msg: Record<string, unknown> = { type: "update", startIndex };
+    let viewChanged = false;
+
+    if (params.datasetId !== prev.datasetId) {
+      msg.datasetId = params.datasetId;
+      viewChanged = true;
+    }
+    if (params.heightMeters !== prev.heightMeters) {
+      msg.heightMeters = params.heightMeters;
+      viewChanged = true;
+    }
+    // compared by value, the server only rebuilds (and sends coordinates) on real changes
+    if (!sameBBox(params.bbox, prev.bbox)) {
+      msg.bbox = params.bbox;
+      viewChanged = true;
+    }
+    if (
+      params.resolution.nx !== prev.resolution.nx ||
+      params.resolution.ny !== prev.resolution.ny
+    ) {
+      msg.nx = params.resolution.nx;
+      msg.ny = params.resolution.ny;
+      viewChanged = true;
+    }
+    if (params.timesteps === prev.timesteps && !viewChanged) return;
+    if (params.timesteps !== prev.timesteps) msg.timesteps = params.timesteps;
+
+    if (viewChanged) {
+      this.lon = undefined;
+      this.lat = undefined;
+    }
+
+    this.params = params;
+    this.position = startIndex;
+    this.frames.clear();
+    this.generation++;
+    if (viewChanged) this.viewGeneration = this.generation;
+    this.send({ ...msg, generation: this.generation });
+  }
+
+  /**
+   * Returns the buffered frame for `index` and acks it so the server can push
+   * the next ones. Seeks if `index` is outside the range being pushed.
+   */
+  take(index: number): WindFieldGrid | undefined {
+    const n = this.params.timesteps.length;
+    const frame = this.frames.get(index);
+    if (!frame) {
+      if ((index - this.position + n) % n > this.window) this.seek(index);
+      return undefined;
+    }
+
+    for (const key of this.frames.keys()) {
+      if ((key - index + n) % n > this.window) this.frames.delete(key);
+    }
+    this.frames.delete(index);
+    this.position = index;
+
+    this.send({ type: "ack", generation: this.generation, index });
+    return frame;
+  }
+
+  close() {
+    this.onFrame = undefined;
+    this.onError = undefined;
+    this.onClose = undefined;
+    this.ws.close();
+  }
+
+  private seek(index: number) {
+    this.position = index;
+    this.frames.clear();
+    this.generation++;
+    this.send({ type: "update", generation: this.generation, startIndex: index });
+  }
+
+  private send(msg: object) {
+    const text = JSON.stringify(msg);
+    if (this.ws.readyState === WebSocket.OPEN) this.ws.send(text);
+    else this.queue.push(text);
+  }
+
+  private receive(data: unknown) {
+    if (typeof data === "string") {
+      const msg = JSON.parse(data) as { type: string; message?: string };
+      if (msg.type === "error") this.onError?.(msg.message ?? "stream error");
+      return;
+    }
+
+    const buf = data as ArrayBuffer;
+    const header = new DataView(buf, 0, HEADER_BYTES);
+    const kind = header.getUint32(0, true);
+    const generation = header.getUint32(4, true);
+    const index = header.getUint32(8, true);
+    const nx = header.getUint32(12, true);
+    const ny = header.getUint32(16, true);
+
+    const count = nx * ny;
+    const a = new Float32Array(buf, HEADER_BYTES, count);
+    const b = new Float32Array(buf, HEADER_BYTES + count * 4, count);
+
+    // coordinates stay valid across seeks, only a view change replaces them
+    if (kind === FRAME_COORDS) {
+      if (generation !== this.viewGeneration) return;
+      this.lon = a;
+      this.lat = b;
+      return;
+    }
+
+    // frames for an older subscription are still in flight
+    if (kind !== FRAME_WIND || generation !== this.generation) return;
+
+    this.frames.set(index, {
+      datasetId: this.params.datasetId,
+      heightMeters: this.params.heightMeters,
+      bbox: this.params.bbox,
+      nx,
+      ny,
+      u: a,
+      v: b,
+      speedMin: header.getFloat32(20, true),
+      speedMax: header.getFloat32(24, true),
+      lon: this.lon,
+      lat: this.lat,
+    });
+    this.onFrame?.(index);
+  }
+}